@@ -1,24 +1,326 @@
 #!/usr/bin/env python3
 
+import codecs
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import guess_json_utf
+from urllib3.util.retry import Retry
 import hashlib
 import json
 import os
-from typing import Dict, List, Optional, Any, Union
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
+from typing import Callable, Dict, Final, List, Literal, NamedTuple, Optional, Any, Tuple, Union
 from datetime import datetime
 from dotenv import load_dotenv
-from checksum import checksum
+from checksum import get_default as get_default_checksum
 
 load_dotenv()
 
-class API:
+class _Request(NamedTuple):
+    """A fully built endpoint call, ready to be sent by either client."""
+    method: Literal['GET', 'POST']
+    url: str
+    binary: bool = False
+
+
+class _RequestBuilder:
     """
-    Complete API client with all endpoints from the mobile app.
+    Builds the request for every endpoint: checksum, ordered query parameters
+    and full URL. Shared by API and AsyncAPI, which only differ in how the
+    request is sent.
+    """
+    
+    __slots__ = ('checksum', '_urls')
+    
+    def __init__(self, checksum, urls: Dict[str, str]):
+        self.checksum = checksum
+        self._urls = urls
+    
+    def _build_url(self, endpoint: str, params: Tuple[Tuple[str, Any], ...] = ()) -> str:
+        """
+        Build the full request URL for an endpoint and an ordered set of query parameters.
+        Parameter names are fixed identifiers, so only the values are quoted; as with
+        a requests params dict, values are stringified and None values are dropped.
+        """
+        url = self._urls[endpoint]
+        query = '&'.join([f"{key}={quote_plus(str(value))}" for key, value in params
+                          if value is not None])
+        if not query:
+            return url
+        return url + '?' + query
+    
+    def _get(self, endpoint: str, params: Tuple[Tuple[str, Any], ...] = (),
+             binary: bool = False) -> _Request:
+        """
+        Build GET request to an endpoint with an already ordered set of query parameters.
+        The URL is built here so the session does not re-encode the query from a dict.
+        """
+        return _Request('GET', self._build_url(endpoint, params), binary)
+    
+    def _roll_endpoint(self, endpoint: str, campus_code: str, roll_number: str,
+                       authen: str, binary: bool = False) -> _Request:
+        """Build GET request to an endpoint taking only campus code, roll number and Authen."""
+        checksum = self.checksum.checksum_k(roll_number, campus_code)
+        
+        params = (
+            ('campusCode', campus_code),
+            ('rollNumber', roll_number),
+            ('Authen', authen),
+            ('checksum', checksum),
+        )
+        
+        return self._get(endpoint, params, binary=binary)
+    
+    # Student Information APIs
+
+    def get_student_by_id(self, campus_code: str, roll_number: str, authen: str) -> _Request:
+        return self._roll_endpoint('GetStudentById', campus_code, roll_number, authen)
+    
+    def get_student_rate(self, campus_code: str, roll_number: str, authen: str) -> _Request:
+        # TODO: 
+        return self._roll_endpoint('GetStudentRate', campus_code, roll_number, authen)
+    
+    def add_rate(self, campus_code: str, authen: str, rate_id: str,
+                 rate_value: str, rate_comment: str) -> _Request:
+        checksum = self.checksum.checksum_k(rate_id, campus_code)
+        
+        params = (
+            ('campusCode', campus_code),
+            ('Authen', authen),
+            ('rateid', rate_id),
+            ('rateValue', rate_value),
+            ('rateComment', rate_comment),
+            ('checksum', checksum),
+        )
+        
+        return _Request('POST', self._build_url('AddRate', params))
+    
+    def get_balance(self, campus_code: str, roll_number: str, authen: str) -> _Request:
+        return self._roll_endpoint('GetBalance', campus_code, roll_number, authen)
+    
+    def get_fee_by_roll(self, campus_code: str, roll_number: str, authen: str) -> _Request:
+        return self._roll_endpoint('GeFeeByRoll', campus_code, roll_number, authen)
+    
+    def get_application(self, campus_code: str, roll_number: str, authen: str) -> _Request:
+        return self._roll_endpoint('GetApplication', campus_code, roll_number, authen)
+    
+    def retrieve_image(self, campus_code: str, roll_number: str, authen: str) -> _Request:
+        return self._roll_endpoint('RetriveImage', campus_code, roll_number, authen, binary=True)
+    
+    # Academic APIs
+
+    def get_diemphongtrao(self, campus_code: str, roll_number: str,
+                         semester: str, authen: str) -> _Request:
+        checksum = self.checksum.checksum_k(roll_number, campus_code)
+        
+        params = (
+            ('campusCode', campus_code),
+            ('rollNumber', roll_number),
+            ('semester', semester),
+            ('Authen', authen),
+            ('checksum', checksum),
+        )
+        
+        return self._get('GetDiemphongtrao', params)
+    
+    # Activity APIs
+
+    def get_activity_student(self, campus_code: str, semester: str,
+                           roll_number: str, authen: str) -> _Request:
+        checksum = self.checksum.checksum_k(roll_number, campus_code)
+        
+        params = (
+            ('campusCode', campus_code),
+            ('rollNumber', roll_number),
+            ('Semester', semester),
+            ('Authen', authen),
+            ('checksum', checksum),
+        )
+        
+        return self._get('GetActivityStudent', params)
+    
+    def get_activity_student_by_week(self, campus_code: str, week: str, roll_number: str,
+                                   semester: str, year: str, authen: str) -> _Request:
+        checksum = self.checksum.checksum_k(roll_number, campus_code)
+        
+        params = (
+            ('campusCode', campus_code),
+            ('week', week),
+            ('rollNumber', roll_number),
+            ('Semester', semester),
+            ('year', year),
+            ('Authen', authen),
+            ('checksum', checksum),
+        )
+        
+        return self._get('GetActivityStudentByWeek', params)
+    
+    # Notification APIs
+
+    def get_notification_by_roll(self, campus_code: str, roll_number: str, authen: str) -> _Request:
+        return self._roll_endpoint('GetNotificationByRoll', campus_code, roll_number, authen)
+    
+    # System APIs
+
+    def get_all_active_campus(self) -> _Request:
+        return self._get('GetAllActiveCampus')
+    
+    def get_version(self) -> _Request:
+        return self._get('GetVersion')
+    
+    def get_campus_info(self, campus_code: str, roll_number: str, authen: str) -> _Request:
+        return self._roll_endpoint('GetCampusInfo', campus_code, roll_number, authen)
+    
+    # Feedback APIs
+
+    def check_open_feedback(self, campus_code: str, roll_number: str, authen: str) -> _Request:
+        return self._roll_endpoint('CheckOpenFeedBack', campus_code, roll_number, authen)
+    
+    def check_update_profile(self, campus_code: str, roll_number: str, authen: str) -> _Request:
+        return self._roll_endpoint('CheckUpdateProfile', campus_code, roll_number, authen)
+    
+    def get_required_survey(self, username: str) -> _Request:
+        checksum = self.checksum.checksum_y(username.lower().strip(), '')
+        
+        params = (
+            ('username', username.lower().strip()),
+            ('checksum', checksum),
+        )
+        
+        return self._get('GetRequiredSurvey', params)
+    
+    # Additional utility methods
+
+    def get_semester(self, campus_code: str, authen: str) -> _Request:
+        checksum = self.checksum.checksum_a(campus_code)
+        
+        params = (
+            ('campusCode', campus_code),
+            ('Authen', authen),
+            ('checksum', checksum),
+        )
+        
+        return self._get('GetSemester', params)
+    
+    def get_subject_by_semester(self, campus_code: str, semester: str,
+                               authen: str) -> _Request:
+        checksum = self.checksum.checksum_k("", campus_code)
+        
+        params = (
+            ('campusCode', campus_code),
+            ('Semester', semester),
+            ('Authen', authen),
+            ('checksum', checksum),
+        )
+        
+        return self._get('GetSubjectBySemester', params)
+    
+    def get_week_by_date(self, timestamp: str) -> _Request:
+        checksum = self.checksum.checksum_a(timestamp)
+        
+        params = (
+            ('date', timestamp),
+        )
+        
+        return self._get('GetWeekByDate', params) 
+    
+    def get_student_attendances(self, campus_code: str, semester: str,
+                                 roll_number: str, authen: str) -> _Request:
+        checksum = self.checksum.checksum_k(roll_number, campus_code)
+        params = (
+            ('campusCode', campus_code),
+            ('Semester', semester),
+            ('rollNumber', roll_number),
+            ('Authen', authen),
+            ('checksum', checksum),
+        )
+        return self._get('GetStudentAttendances', params)
+    
+    def get_exam_schedule(self, campus_code: str, semester: str,
+                            roll_number: str, authen: str) -> _Request:
+        checksum = self.checksum.checksum_k(roll_number, campus_code)
+        params = (
+            ('campusCode', campus_code),
+            ('rollNumber', roll_number),
+            ('Semester', semester),
+            ('Authen', authen),
+            ('checksum', checksum),
+        )
+        return self._get('GetScheduleExam', params)
+    
+    def get_student_mark(self, campus_code: str, semester: str,
+                          roll_number: str, authen: str) -> _Request:
+        checksum = self.checksum.checksum_k(roll_number, campus_code)
+        params = (
+            ('campusCode', campus_code),
+            ('rollNumber', roll_number),
+            ('Semester', semester),
+            ('Authen', authen),
+            ('checksum', checksum),
+        )
+        return self._get('GetStudentMark', params)
+    
+    def get_top10_news(self, campus_code: str, authen: str, news_type: str) -> _Request:
+        checksum = self.checksum.checksum_k(news_type, campus_code)
+        
+        params = (
+            ('campusCode', campus_code),
+            ('Authen', authen),
+            ('type', news_type),
+            ('checksum', checksum),
+        )
+        
+        return self._get('GetTop10News', params)
+    
+    def get_mark_by_course(self, campus_code: str, course_id: str,
+                          roll_number: str, authen: str) -> _Request:
+        checksum = self.checksum.checksum_k(roll_number, campus_code)
+        
+        params = (
+            ('campusCode', campus_code),
+            ('CourseId', course_id),
+            ('rollNumber', roll_number),
+            ('Authen', authen),
+            ('checksum', checksum),
+        )
+        
+        return self._get('GetMarkByCourse', params)
+
+
+class _BaseAPI:
+    """
+    Configuration and response handling shared by API and AsyncAPI.
     """
     
+    __slots__ = ('AUTHEN_KEY', 'checksum', '_requests')
+    
     # Base URLs
-    BASE_URL = os.getenv('BASE_URL')
-    GOOGLE_AUTH_URL = os.getenv('GOOGLE_AUTH_URL')
+    BASE_URL: Final = os.getenv('BASE_URL')
+    GOOGLE_AUTH_URL: Final = os.getenv('GOOGLE_AUTH_URL')
+    
+    # Endpoint paths served by BASE_URL
+    ENDPOINTS: Final = (
+        'GetStudentById', 'GetStudentRate', 'AddRate', 'GetBalance', 'GeFeeByRoll',
+        'GetApplication', 'RetriveImage', 'GetDiemphongtrao', 'GetActivityStudent',
+        'GetActivityStudentByWeek', 'GetNotificationByRoll', 'GetAllActiveCampus',
+        'GetVersion', 'GetCampusInfo', 'CheckOpenFeedBack', 'CheckUpdateProfile',
+        'GetSemester', 'GetSubjectBySemester', 'GetWeekByDate', 'GetStudentAttendances',
+        'GetScheduleExam', 'GetStudentMark', 'GetTop10News', 'GetMarkByCourse'
+    )
+    
+    # Endpoint paths served by GOOGLE_AUTH_URL
+    GOOGLE_AUTH_ENDPOINTS: Final = (
+        'GetRequiredSurvey',
+    )
+    
+    DEFAULT_HEADERS: Final = {
+        'Content-Type': 'application/json',
+        'User-Agent': 'okhttp/3.12.1'
+    }
     
     def __init__(self):
         # Load authentication key from environment variables
@@ -29,16 +331,111 @@ class API:
                 "Please set it in your .env file."
             )
         
-        self.checksum = checksum()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'okhttp/3.12.1'
-        })
-    
-    def _make_request(self, method: str, url: str, params: Optional[Dict] = None, 
-                     data: Optional[Dict] = None, use_json: bool = True) -> Dict[str, Any]:
-        """Make HTTP request with error handling."""
+        self.checksum = get_default_checksum()
+        
+        # Full endpoint URLs, built once instead of formatted on every call
+        urls = {name: f"{self.BASE_URL}/{name}" for name in self.ENDPOINTS}
+        urls.update({name: f"{self.GOOGLE_AUTH_URL}/{name}" for name in self.GOOGLE_AUTH_ENDPOINTS})
+        self._requests = _RequestBuilder(self.checksum, urls)
+    
+    @staticmethod
+    def _build_result(status_code: int, content: bytes, get_text: Callable[[], str],
+                      binary: bool = False, content_type: str = '') -> Dict[str, Any]:
+        """
+        Build the endpoint result dict from a response status and body.
+        The body is only decoded to text (raw_response) when it is not valid JSON.
+        With binary=True the body bytes are returned as data, unless the server
+        answered with JSON (e.g. an error payload), which is handled as usual.
+        """
+        if binary and 'json' not in content_type.lower():
+            return {
+                'success': status_code == 200,
+                'status_code': status_code,
+                'data': content
+            }
+        
+        # Parse JSON response if possible; empty bodies (e.g. from the
+        # check endpoints) skip the parser entirely
+        json_data = None
+        text = None
+        if content:
+            if content.startswith(codecs.BOM_UTF8):
+                content = content[len(codecs.BOM_UTF8):]
+            try:
+                json_data = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # orjson only reads UTF-8: retry on the decoded body, using the
+                # UTF-16/32 detection of response.json() or else the response's
+                # own encoding
+                encoding = guess_json_utf(content)
+                try:
+                    if encoding and encoding != 'utf-8':
+                        text = content.decode(encoding)
+                    else:
+                        text = get_text()
+                    json_data = orjson.loads(text)
+                except (UnicodeDecodeError, orjson.JSONDecodeError):
+                    pass
+        
+        # Determine success based on HTTP status and JSON response
+        is_success = status_code == 200
+        if json_data and 'code' in json_data:
+            # API returns success info in JSON code field
+            is_success = is_success and json_data['code'] == '200'
+        result = {
+            'success': is_success,
+            'status_code': status_code,
+            'data': json_data
+        }
+        if json_data is None:
+            if text is None:
+                text = get_text() if content else ''
+            result['raw_response'] = text
+        return result
+
+
+class API(_BaseAPI):
+    """
+    Complete API client with all endpoints from the mobile app.
+    """
+    
+    __slots__ = ('session',)
+    
+    def __init__(self):
+        super().__init__()
+        self.session = self._create_session()
+    
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session shared by all endpoint calls."""
+        session = requests.Session()
+        session.headers.update(self.DEFAULT_HEADERS)
+        session.headers['Connection'] = 'keep-alive'
+        
+        # Keep enough pooled connections for bursts of endpoint calls and
+        # retry transient server errors. Only GET is retried on error
+        # statuses, so a failed AddRate is never submitted twice.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset(['GET']),
+                raise_on_status=False
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _make_request(self, method: Literal['GET', 'POST'], url: str, params: Optional[Dict] = None, 
+                     data: Optional[Dict] = None, use_json: bool = True,
+                     binary: bool = False) -> Dict[str, Any]:
+        """
+        Make HTTP request with error handling.
+        With binary=True non-JSON bodies are returned as raw bytes, without parsing.
+        """
         try:
             if method.upper() == 'GET':
                 response = self.session.get(url, params=params)
@@ -50,24 +447,9 @@ class API:
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
-            # Parse JSON response if possible
-            json_data = None
-            try:
-                json_data = response.json()
-            except:
-                pass
-            
-            # Determine success based on HTTP status and JSON response
-            is_success = response.status_code == 200
-            if json_data and 'code' in json_data:
-                # API returns success info in JSON code field
-                is_success = is_success and json_data['code'] == '200'
-            return {
-                'success': is_success,
-                'status_code': response.status_code,
-                'data': json_data,
-                'raw_response': response.text
-            }
+            return self._build_result(response.status_code, response.content,
+                                      lambda: response.text, binary,
+                                      response.headers.get('Content-Type', ''))
         except Exception as e:
             return {
                 'success': False,
@@ -75,363 +457,385 @@ class API:
                 'status_code': None,
                 'data': None
             }
+    
+    def _send(self, request: _Request) -> Dict[str, Any]:
+        """Send a built endpoint request."""
+        return self._make_request(request.method, request.url, binary=request.binary)
+
+    def batch(self, calls: List[Tuple[str, tuple, dict]], max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Call several independent endpoints concurrently.
+        
+        Each call is a (method_name, args, kwargs) tuple, e.g.
+        ('get_balance', (campus_code, roll_number, authen), {}). Results are
+        returned keyed by method name, in the order the calls were given.
+        The session and checksum generator are shared by the worker threads;
+        both are safe for concurrent use (checksum caches are lru_cache based
+        and its hourly timestamp refresh is idempotent).
+        """
+        names = [name for name, _, _ in calls]
+        if len(set(names)) != len(names):
+            raise ValueError("Each endpoint may only appear once per batch.")
+        
+        methods = [getattr(self, name) for name in names]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(method, *args, **kwargs)
+                       for method, (_, args, kwargs) in zip(methods, calls)]
+            return {name: future.result() for name, future in zip(names, futures)}
 
     # Student Information APIs
 
     def get_student_by_id(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
         """Get student information."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/GetStudentById"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_student_by_id(campus_code, roll_number, authen))
     
     def get_student_rate(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
         """Get student rating information."""
-        # TODO: 
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/GetStudentRate"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_student_rate(campus_code, roll_number, authen))
     
-    def add_rate(self, campus_code: str, authen: str, rate_id: str, 
+    def add_rate(self, campus_code: str, authen: str, rate_id: str,
                  rate_value: str, rate_comment: str) -> Dict[str, Any]:
         """Submit student rating."""
-        checksum = self.checksum.checksum_k(rate_id, campus_code)
-        
-        url = f"{self.BASE_URL}/AddRate"
-        params = {
-            'campusCode': campus_code,
-            'Authen': authen,
-            'rateid': rate_id,
-            'rateValue': rate_value,
-            'rateComment': rate_comment,
-            'checksum': checksum
-        }
-        
-        return self._make_request('POST', url, params=params)
+        return self._send(self._requests.add_rate(campus_code, authen, rate_id, rate_value, rate_comment))
     
     def get_balance(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
         """Get student account balance."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/GetBalance"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_balance(campus_code, roll_number, authen))
     
     def get_fee_by_roll(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
         """Get student fee information."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/GeFeeByRoll"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_fee_by_roll(campus_code, roll_number, authen))
     
     def get_application(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
         """Get student applications."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/GetApplication"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_application(campus_code, roll_number, authen))
     
     def retrieve_image(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
-        """Retrieve student profile image."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/RetriveImage"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        """Retrieve student profile image. The image bytes are returned as data."""
+        return self._send(self._requests.retrieve_image(campus_code, roll_number, authen))
     
     # Academic APIs
-    
-    def get_diemphongtrao(self, campus_code: str, roll_number: str, 
+
+    def get_diemphongtrao(self, campus_code: str, roll_number: str,
                          semester: str, authen: str) -> Dict[str, Any]:
         """Get extra-curricular points."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/GetDiemphongtrao"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'semester': semester,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_diemphongtrao(campus_code, roll_number, semester, authen))
     
     # Activity APIs
-    
-    def get_activity_student(self, campus_code: str, semester: str, 
+
+    def get_activity_student(self, campus_code: str, semester: str,
                            roll_number: str, authen: str) -> Dict[str, Any]:
         """Get student activities for a semester."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/GetActivityStudent"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Semester': semester,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_activity_student(campus_code, semester, roll_number, authen))
     
     def get_activity_student_by_week(self, campus_code: str, week: str, roll_number: str,
                                    semester: str, year: str, authen: str) -> Dict[str, Any]:
         """Get student activities for a specific week."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/GetActivityStudentByWeek"
-        params = {
-            'campusCode': campus_code,
-            'week': week,
-            'rollNumber': roll_number,
-            'Semester': semester,
-            'year': year,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_activity_student_by_week(campus_code, week, roll_number, semester, year, authen))
     
     # Notification APIs
-    
+
     def get_notification_by_roll(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
         """Get notifications by roll number."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/GetNotificationByRoll"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_notification_by_roll(campus_code, roll_number, authen))
     
     # System APIs
-    
+
     def get_all_active_campus(self) -> Dict[str, Any]:
         """Get all active campus information."""
-        url = f"{self.BASE_URL}/GetAllActiveCampus"
-        return self._make_request('GET', url)
+        return self._send(self._requests.get_all_active_campus())
     
     def get_version(self) -> Dict[str, Any]:
         """Get API version information."""
-        url = f"{self.BASE_URL}/GetVersion"
-        return self._make_request('GET', url)
+        return self._send(self._requests.get_version())
     
     def get_campus_info(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
         """Get campus information."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/GetCampusInfo"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_campus_info(campus_code, roll_number, authen))
     
     # Feedback APIs
-    
+
     def check_open_feedback(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
         """Check if feedback is open."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/CheckOpenFeedBack"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.check_open_feedback(campus_code, roll_number, authen))
     
     def check_update_profile(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
         """Check if profile update is required."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/CheckUpdateProfile"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.check_update_profile(campus_code, roll_number, authen))
     
     def get_required_survey(self, username: str) -> Dict[str, Any]:
         """
         Get required survey information.
         Uses the Google authentication server.
         """
-        checksum = self.checksum.checksum_y(username.lower().strip(), '')
-        
-        url = f"{self.GOOGLE_AUTH_URL}/GetRequiredSurvey"
-        params = {
-            'username': username.lower().strip(),
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_required_survey(username))
     
     # Additional utility methods
-    
+
     def get_semester(self, campus_code: str, authen: str) -> Dict[str, Any]:
         """Get all available semesters."""
-        checksum = self.checksum.checksum_a(campus_code)
-        
-        url = f"{self.BASE_URL}/GetSemester"
-        params = {
-            'campusCode': campus_code,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_semester(campus_code, authen))
     
-    def get_subject_by_semester(self, campus_code: str, semester: str, 
+    def get_subject_by_semester(self, campus_code: str, semester: str,
                                authen: str) -> Dict[str, Any]:
         """Get subjects for a specific semester."""
-        checksum = self.checksum.checksum_k("", campus_code)
-        
-        url = f"{self.BASE_URL}/GetSubjectBySemester"
-        params = {
-            'campusCode': campus_code,
-            'Semester': semester,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_subject_by_semester(campus_code, semester, authen))
     
     def get_week_by_date(self, timestamp: str) -> Dict[str, Any]:
         """Get week number by date timestamp."""
-        checksum = self.checksum.checksum_a(timestamp)
-        
-        url = f"{self.BASE_URL}/GetWeekByDate"
-        params = {
-            'date': timestamp,
-        }
-        
-        return self._make_request('GET', url, params=params) 
-
+        return self._send(self._requests.get_week_by_date(timestamp))
+    
     def get_student_attendances(self, campus_code: str, semester: str,
                                  roll_number: str, authen: str) -> Dict[str, Any]:
         """Get student attendance summary for a semester."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        url = f"{self.BASE_URL}/GetStudentAttendances"
-        params = {
-            'campusCode': campus_code,
-            'Semester': semester,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_student_attendances(campus_code, semester, roll_number, authen))
     
     def get_exam_schedule(self, campus_code: str, semester: str,
                             roll_number: str, authen: str) -> Dict[str, Any]:
         """Get student exam schedule for a semester."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        url = f"{self.BASE_URL}/GetScheduleExam"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Semester': semester,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_exam_schedule(campus_code, semester, roll_number, authen))
     
     def get_student_mark(self, campus_code: str, semester: str,
                           roll_number: str, authen: str) -> Dict[str, Any]:
         """Get student marks summary for a semester."""
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        url = f"{self.BASE_URL}/GetStudentMark"
-        params = {
-            'campusCode': campus_code,
-            'rollNumber': roll_number,
-            'Semester': semester,
-            'Authen': authen,
-            'checksum': checksum
-        }
-        return self._make_request('GET', url, params=params)
+        return self._send(self._requests.get_student_mark(campus_code, semester, roll_number, authen))
     
     def get_top10_news(self, campus_code: str, authen: str, news_type: str) -> Dict[str, Any]:
-        checksum = self.checksum.checksum_k(news_type, campus_code)
-        
-        url = f"{self.BASE_URL}/GetTop10News"
-        params = {
-            'campusCode': campus_code,
-            'Authen': authen,
-            'type': news_type,
-            'checksum': checksum
-        }
-        
-        return self._make_request('GET', url, params=params)
-
+        return self._send(self._requests.get_top10_news(campus_code, authen, news_type))
+    
     def get_mark_by_course(self, campus_code: str, course_id: str,
                           roll_number: str, authen: str) -> Dict[str, Any]:
         """
         Get detailed marks/grades for a specific course.
         Returns grade breakdown including assignments, tests, projects, and exams.
         """
-        checksum = self.checksum.checksum_k(roll_number, campus_code)
-        
-        url = f"{self.BASE_URL}/GetMarkByCourse"
-        params = {
-            'campusCode': campus_code,
-            'CourseId': course_id,
-            'rollNumber': roll_number,
-            'Authen': authen,
-            'checksum': checksum
-        }
+        return self._send(self._requests.get_mark_by_course(campus_code, course_id, roll_number, authen))
+
+
+class AsyncAPI(_BaseAPI):
+    """
+    Asynchronous API client backed by httpx with HTTP/2 enabled.
+    
+    Provides the same endpoint methods as API as coroutines, resolving to the
+    same result dict as their synchronous counterparts. Independent endpoints
+    can therefore be fetched concurrently:
+    
+        async with AsyncAPI() as api:
+            balance, marks = await asyncio.gather(
+                api.get_balance(campus_code, roll_number, authen),
+                api.get_student_mark(campus_code, semester, roll_number, authen),
+            )
+    
+    When the server negotiates HTTP/2, concurrent requests are multiplexed
+    over a single connection instead of opening one connection per request.
+    """
+    
+    __slots__ = ('session',)
+    
+    def __init__(self):
+        super().__init__()
+        # The client is bound to the event loop it first runs on,
+        # so creation is deferred until the client is first used.
+        self.session: Optional[httpx.AsyncClient] = None
+    
+    def _get_session(self) -> httpx.AsyncClient:
+        """Return the shared httpx client, creating it on first use."""
+        if self.session is None or self.session.is_closed:
+            # Follow redirects and never time out, matching the requests session
+            # used by API (httpx defaults to neither)
+            self.session = httpx.AsyncClient(
+                http2=True,
+                headers=self.DEFAULT_HEADERS,
+                follow_redirects=True,
+                timeout=None,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32, keepalive_expiry=75)
+            )
+        return self.session
+    
+    async def __aenter__(self) -> 'AsyncAPI':
+        self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the underlying httpx client."""
+        if self.session is not None:
+            await self.session.aclose()
+            self.session = None
+    
+    async def batch(self, calls: List[Tuple[str, tuple, dict]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Call several independent endpoints concurrently on the event loop.
+        Same call format and result as API.batch.
+        """
+        names = [name for name, _, _ in calls]
+        if len(set(names)) != len(names):
+            raise ValueError("Each endpoint may only appear once per batch.")
         
-        return self._make_request('GET', url, params=params)
\ No newline at end of file
+        results = await asyncio.gather(*(getattr(self, name)(*args, **kwargs)
+                                         for name, args, kwargs in calls))
+        return dict(zip(names, results))
+    
+    async def _make_request(self, method: Literal['GET', 'POST'], url: str, params: Optional[Dict] = None,
+                            data: Optional[Dict] = None, use_json: bool = True,
+                            binary: bool = False) -> Dict[str, Any]:
+        """
+        Make HTTP request with error handling.
+        With binary=True non-JSON bodies are returned as raw bytes, without parsing.
+        """
+        try:
+            session = self._get_session()
+            if method.upper() == 'GET':
+                response = await session.get(url, params=params)
+            elif method.upper() == 'POST':
+                if use_json:
+                    response = await session.post(url, params=params, json=data)
+                else:
+                    response = await session.post(url, params=params, data=data)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            return self._build_result(response.status_code, response.content,
+                                      lambda: response.text, binary,
+                                      response.headers.get('Content-Type', ''))
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'status_code': None,
+                'data': None
+            }
+    
+    async def _send(self, request: _Request) -> Dict[str, Any]:
+        """Send a built endpoint request."""
+        return await self._make_request(request.method, request.url, binary=request.binary)
+    
+    # Student Information APIs
+
+    async def get_student_by_id(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
+        """Get student information."""
+        return await self._send(self._requests.get_student_by_id(campus_code, roll_number, authen))
+    
+    async def get_student_rate(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
+        """Get student rating information."""
+        return await self._send(self._requests.get_student_rate(campus_code, roll_number, authen))
+    
+    async def add_rate(self, campus_code: str, authen: str, rate_id: str,
+                       rate_value: str, rate_comment: str) -> Dict[str, Any]:
+        """Submit student rating."""
+        return await self._send(self._requests.add_rate(campus_code, authen, rate_id, rate_value, rate_comment))
+    
+    async def get_balance(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
+        """Get student account balance."""
+        return await self._send(self._requests.get_balance(campus_code, roll_number, authen))
+    
+    async def get_fee_by_roll(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
+        """Get student fee information."""
+        return await self._send(self._requests.get_fee_by_roll(campus_code, roll_number, authen))
+    
+    async def get_application(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
+        """Get student applications."""
+        return await self._send(self._requests.get_application(campus_code, roll_number, authen))
+    
+    async def retrieve_image(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
+        """Retrieve student profile image. The image bytes are returned as data."""
+        return await self._send(self._requests.retrieve_image(campus_code, roll_number, authen))
+    
+    # Academic APIs
+
+    async def get_diemphongtrao(self, campus_code: str, roll_number: str,
+                               semester: str, authen: str) -> Dict[str, Any]:
+        """Get extra-curricular points."""
+        return await self._send(self._requests.get_diemphongtrao(campus_code, roll_number, semester, authen))
+    
+    # Activity APIs
+
+    async def get_activity_student(self, campus_code: str, semester: str,
+                                 roll_number: str, authen: str) -> Dict[str, Any]:
+        """Get student activities for a semester."""
+        return await self._send(self._requests.get_activity_student(campus_code, semester, roll_number, authen))
+    
+    async def get_activity_student_by_week(self, campus_code: str, week: str, roll_number: str,
+                                         semester: str, year: str, authen: str) -> Dict[str, Any]:
+        """Get student activities for a specific week."""
+        return await self._send(self._requests.get_activity_student_by_week(campus_code, week, roll_number, semester, year, authen))
+    
+    # Notification APIs
+
+    async def get_notification_by_roll(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
+        """Get notifications by roll number."""
+        return await self._send(self._requests.get_notification_by_roll(campus_code, roll_number, authen))
+    
+    # System APIs
+
+    async def get_all_active_campus(self) -> Dict[str, Any]:
+        """Get all active campus information."""
+        return await self._send(self._requests.get_all_active_campus())
+    
+    async def get_version(self) -> Dict[str, Any]:
+        """Get API version information."""
+        return await self._send(self._requests.get_version())
+    
+    async def get_campus_info(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
+        """Get campus information."""
+        return await self._send(self._requests.get_campus_info(campus_code, roll_number, authen))
+    
+    # Feedback APIs
+
+    async def check_open_feedback(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
+        """Check if feedback is open."""
+        return await self._send(self._requests.check_open_feedback(campus_code, roll_number, authen))
+    
+    async def check_update_profile(self, campus_code: str, roll_number: str, authen: str) -> Dict[str, Any]:
+        """Check if profile update is required."""
+        return await self._send(self._requests.check_update_profile(campus_code, roll_number, authen))
+    
+    async def get_required_survey(self, username: str) -> Dict[str, Any]:
+        """
+        Get required survey information.
+        Uses the Google authentication server.
+        """
+        return await self._send(self._requests.get_required_survey(username))
+    
+    # Additional utility methods
+
+    async def get_semester(self, campus_code: str, authen: str) -> Dict[str, Any]:
+        """Get all available semesters."""
+        return await self._send(self._requests.get_semester(campus_code, authen))
+    
+    async def get_subject_by_semester(self, campus_code: str, semester: str,
+                                     authen: str) -> Dict[str, Any]:
+        """Get subjects for a specific semester."""
+        return await self._send(self._requests.get_subject_by_semester(campus_code, semester, authen))
+    
+    async def get_week_by_date(self, timestamp: str) -> Dict[str, Any]:
+        """Get week number by date timestamp."""
+        return await self._send(self._requests.get_week_by_date(timestamp))
+    
+    async def get_student_attendances(self, campus_code: str, semester: str,
+                                       roll_number: str, authen: str) -> Dict[str, Any]:
+        """Get student attendance summary for a semester."""
+        return await self._send(self._requests.get_student_attendances(campus_code, semester, roll_number, authen))
+    
+    async def get_exam_schedule(self, campus_code: str, semester: str,
+                                  roll_number: str, authen: str) -> Dict[str, Any]:
+        """Get student exam schedule for a semester."""
+        return await self._send(self._requests.get_exam_schedule(campus_code, semester, roll_number, authen))
+    
+    async def get_student_mark(self, campus_code: str, semester: str,
+                                roll_number: str, authen: str) -> Dict[str, Any]:
+        """Get student marks summary for a semester."""
+        return await self._send(self._requests.get_student_mark(campus_code, semester, roll_number, authen))
+    
+    async def get_top10_news(self, campus_code: str, authen: str, news_type: str) -> Dict[str, Any]:
+        return await self._send(self._requests.get_top10_news(campus_code, authen, news_type))
+    
+    async def get_mark_by_course(self, campus_code: str, course_id: str,
+                                roll_number: str, authen: str) -> Dict[str, Any]:
+        """
+        Get detailed marks/grades for a specific course.
+        Returns grade breakdown including assignments, tests, projects, and exams.
+        """
+        return await self._send(self._requests.get_mark_by_course(campus_code, course_id, roll_number, authen))
@@ -4,13 +4,28 @@ API Checksum Implementation
 Python equivalent of the JavaScript checksum functions found in the React Native bundle.
 """
 
+import binascii
 import hmac
 import hashlib
 import os
-from datetime import datetime
+import threading
+import time
+import warnings
+from functools import lru_cache
+from datetime import datetime, timedelta
 import urllib.parse
 from dotenv import load_dotenv
 
+# hashlib (and hmac with digestmod=hashlib.sha1) uses OpenSSL's SHA-1, which
+# uses the CPU's SHA extensions where available, unless Python was built
+# without it.
+if getattr(hashlib.sha1, '__name__', '') != 'openssl_sha1':
+    warnings.warn(
+        "hashlib is not using OpenSSL for SHA-1; checksums will fall back to the "
+        "slower builtin implementation. Use a Python build linked against OpenSSL.",
+        RuntimeWarning
+    )
+
 load_dotenv()
 
 class checksum:
@@ -19,6 +34,12 @@ class checksum:
     Implements the three checksum functions (k, y, A) found in the mobile app.
     """
     
+    __slots__ = (
+        'SECRET_KEY_MAIN', 'SECRET_KEY_ALT', 'SECRET_KEY_LONG', 'SUPER_SECRET_CODE',
+        '_mac_main', '_mac_alt', '_super_bytes', '_long_bytes', '_ts_str', '_ts_expires',
+        '_cached_k', '_cached_y', '_cached_a'
+    )
+    
     def __init__(self):
         """
         Initialize the checksum generator with secret keys from environment variables.
@@ -34,16 +55,40 @@ class checksum:
                 "Missing required environment variables. Please ensure SECRET_KEY_MAIN, "
                 "SECRET_KEY_ALT, SECRET_KEY_LONG and SUPER_SECRET_CODE are set in your .env file."
             )
+        
+        # Keyed HMAC-SHA1 states, copied for every signature instead of
+        # re-deriving the key pads on each call
+        self._mac_main = hmac.new(self.SECRET_KEY_MAIN.encode('utf-8'), digestmod=hashlib.sha1)
+        self._mac_alt = hmac.new(self.SECRET_KEY_ALT.encode('utf-8'), digestmod=hashlib.sha1)
+        
+        # Constant message parts, encoded once
+        self._super_bytes = self.SUPER_SECRET_CODE.encode('utf-8')
+        self._long_bytes = self.SECRET_KEY_LONG.encode('utf-8')
+        
+        # Cached hourly timestamp and the epoch time at which it expires
+        self._ts_str = ''
+        self._ts_expires = 0.0
+        
+        # A checksum only changes with the hourly timestamp, so results are
+        # memoized per (arguments, timestamp); stale hours age out of the LRU.
+        # Arguments are stringified before the lookup so that e.g. 1, True
+        # and 1.0 get separate entries, as they sign different messages.
+        self._cached_k = lru_cache(maxsize=1024)(self._compute_k)
+        self._cached_y = lru_cache(maxsize=1024)(self._compute_y)
+        self._cached_a = lru_cache(maxsize=1024)(self._compute_a)
     
-    @staticmethod
-    def get_timestamp():
+    def get_timestamp(self):
         """
         Get current timestamp in the format used by the original API: DD/MM/YYYY HH:00
         Rounded to the current hour, matching JavaScript moment format.
+        The formatted string is cached until the next local hour boundary.
         """
-        now = datetime.now()
-        # Format to match JavaScript: DD/MM/YYYY HH:00
-        return now.strftime('%d/%m/%Y %H:00')
+        if time.time() >= self._ts_expires:
+            hour = datetime.now().replace(minute=0, second=0, microsecond=0)
+            # Format to match JavaScript: DD/MM/YYYY HH:00
+            self._ts_str = hour.strftime('%d/%m/%Y %H:00')
+            self._ts_expires = (hour + timedelta(hours=1)).timestamp()
+        return self._ts_str
     
     @staticmethod
     def generate_hmac(key, message):
@@ -59,11 +104,24 @@ class checksum:
         hmac_obj = hmac.new(key_bytes, message_bytes, hashlib.sha1)
         
         # Get base64 encoded result
-        import base64
-        result = base64.b64encode(hmac_obj.digest()).decode('utf-8')
+        result = binascii.b2a_base64(hmac_obj.digest(), newline=False).decode('utf-8')
         
         return result
     
+    @staticmethod
+    def _sign(mac, message):
+        """
+        Sign a bytes message with a precomputed keyed HMAC and return the URL-encoded
+        base64 result, equivalent to url_encode_checksum(generate_hmac(...)).
+        """
+        mac = mac.copy()
+        mac.update(message)
+        encoded = binascii.b2a_base64(mac.digest(), newline=False).decode('ascii')
+        # Base64 never contains spaces and '=' only appears as trailing
+        # padding, so only the padding needs rewriting.
+        stripped = encoded.rstrip('=')
+        return stripped + '%3d' * (len(encoded) - len(stripped))
+    
     @staticmethod
     def url_encode_checksum(checksum):
         """
@@ -84,11 +142,13 @@ class checksum:
         Returns:
             str: URL-encoded checksum
         """
-        timestamp = self.get_timestamp()
-        message = f"{roll_number}{self.SUPER_SECRET_CODE}{campus_code}{timestamp}"
+        return self._cached_k(str(roll_number), str(campus_code), self.get_timestamp())
+    
+    def _compute_k(self, roll_number, campus_code, timestamp):
+        message = b''.join((roll_number.encode('utf-8'), self._super_bytes,
+                            campus_code.encode('utf-8'), timestamp.encode('utf-8')))
         
-        checksum = self.generate_hmac(self.SECRET_KEY_MAIN, message)
-        return self.url_encode_checksum(checksum)
+        return self._sign(self._mac_main, message)
     
     def checksum_y(self, username, campus_code):
         """
@@ -102,11 +162,13 @@ class checksum:
         Returns:
             str: URL-encoded checksum
         """
-        timestamp = self.get_timestamp()
-        message = f"{username}{self.SUPER_SECRET_CODE}{campus_code}{timestamp}"
+        return self._cached_y(str(username), str(campus_code), self.get_timestamp())
+    
+    def _compute_y(self, username, campus_code, timestamp):
+        message = b''.join((username.encode('utf-8'), self._super_bytes,
+                            campus_code.encode('utf-8'), timestamp.encode('utf-8')))
         
-        checksum = self.generate_hmac(self.SECRET_KEY_ALT, message)
-        return self.url_encode_checksum(checksum)
+        return self._sign(self._mac_alt, message)
     
     def checksum_a(self, parameter):
         """
@@ -119,8 +181,26 @@ class checksum:
         Returns:
             str: URL-encoded checksum
         """
-        timestamp = self.get_timestamp()
-        message = f"{self.SECRET_KEY_LONG}{parameter}{timestamp}"
+        return self._cached_a(str(parameter), self.get_timestamp())
+    
+    def _compute_a(self, parameter, timestamp):
+        message = b''.join((self._long_bytes, parameter.encode('utf-8'), timestamp.encode('utf-8')))
         
-        checksum = self.generate_hmac(self.SECRET_KEY_MAIN, message)
-        return self.url_encode_checksum(checksum)
\ No newline at end of file
+        return self._sign(self._mac_main, message)
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_default():
+    """
+    Get the process-wide checksum generator, creating it on first use.
+    Shared so that every API client reuses the same keys and caches.
+    """
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = checksum()
+    return _default